@@ -1,24 +1,96 @@
 import asyncio
+import httpx
+from contextlib import AsyncExitStack
+from datetime import timedelta
 from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import load_mcp_tools
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import ToolMessage
 import json
 
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, default=str).decode()
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    def _dumps(obj) -> str:
+        return json.dumps(obj, default=str)
+
 load_dotenv()
 
+# Results with more text than this (~64 KB) are encoded off the event loop
+LARGE_RESULT_CHARS = 64 * 1024
+
+def _result_size(result) -> int:
+    """Text length of a tool result: a string or a list of content blocks"""
+    if isinstance(result, str):
+        return len(result)
+    if isinstance(result, list):
+        return sum(
+            len(block) if isinstance(block, str) else len(block.get("text") or "")
+            for block in result
+            if isinstance(block, (str, dict))
+        )
+    return 0
+
 SERVERS = { 
     
     "expense": {
         "transport": "streamable_http",  # if this fails, try "sse"
-        "url": "https://splendid-gold-dingo.fastmcp.app/mcp"
+        "url": "https://splendid-gold-dingo.fastmcp.app/mcp",
+        # The streamable-http client always passes a timeout to the factory
+        # built from this, so this is where the 60s is set
+        "timeout": timedelta(seconds=60),
+        "httpx_client_factory": lambda headers=None, timeout=None, auth=None: httpx.AsyncClient(
+            headers=headers,
+            timeout=timeout,
+            auth=auth,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        )
     }
 }
 
+# Shared across invocations so the tool schema is only fetched once per process.
+# get_tools() would open a new session (and httpx client) for every tool call,
+# so tools are loaded from one long-lived session that all calls reuse.
+_client = MultiServerMCPClient(SERVERS)
+_session_stack = AsyncExitStack()
+_tools_cache: list | None = None
+_tools_lock = asyncio.Lock()
+
+async def _get_tools():
+    # Must be awaited from the task that later calls _close_session
+    global _tools_cache
+    async with _tools_lock:
+        if _tools_cache is None:
+            session = await _session_stack.enter_async_context(_client.session("expense"))
+            _tools_cache = await load_mcp_tools(session)
+    return _tools_cache
+
+async def _close_session():
+    global _tools_cache
+    _tools_cache = None
+    await _session_stack.aclose()
+
+async def _warm_llm(llm):
+    # Cheap metadata request that opens the TLS connection the first ainvoke will reuse
+    try:
+        await llm.root_async_client.models.retrieve(llm.model_name)
+    except Exception:
+        pass
+
 async def main():
     
-    client = MultiServerMCPClient(SERVERS)
-    tools = await client.get_tools()
+    llm = ChatOpenAI(model="gpt-5")
+
+    # Warm both HTTPS endpoints concurrently before the prompt hits the critical path.
+    # The MCP session is opened in this task so it can be closed from it.
+    warm_llm = asyncio.create_task(_warm_llm(llm))
+    tools = await _get_tools()
+    await warm_llm
 
 
     named_tools = {}
@@ -27,7 +99,6 @@ async def main():
 
     print("Available tools:", named_tools.keys())
 
-    llm = ChatOpenAI(model="gpt-5")
     llm_with_tools = llm.bind_tools(tools)
 
     prompt = "Draw a triangle rotating in place using the manim tool."
@@ -37,19 +108,39 @@ async def main():
         print("\nLLM Reply:", response.content)
         return
 
+    async def call_tool(tc):
+        tool = named_tools.get(tc["name"])
+        if tool is None:
+            return {"status": "error", "message": f"Unknown tool: {tc['name']}"}
+        return await tool.ainvoke(tc.get("args") or {})
+
+    # Independent tool calls run concurrently; a failing call must not cancel the batch
+    results = await asyncio.gather(
+        *(call_tool(tc) for tc in response.tool_calls),
+        return_exceptions=True
+    )
+
     tool_messages = []
-    for tc in response.tool_calls:
-        selected_tool = tc["name"]
-        selected_tool_args = tc.get("args") or {}
-        selected_tool_id = tc["id"]
+    for tc, result in zip(response.tool_calls, results):
+        if isinstance(result, BaseException):
+            result = {"status": "error", "message": str(result)}
+        if _result_size(result) > LARGE_RESULT_CHARS:
+            content = await asyncio.to_thread(_dumps, result)
+        else:
+            content = _dumps(result)
+        tool_messages.append(ToolMessage(tool_call_id=tc["id"], content=content))
 
-        result = await named_tools[selected_tool].ainvoke(selected_tool_args)
-        tool_messages.append(ToolMessage(tool_call_id=selected_tool_id, content=json.dumps(result)))
-        
 
     final_response = await llm_with_tools.ainvoke([prompt, response, *tool_messages])
     print(f"Final response: {final_response.content}")
 
 
+async def _run():
+    try:
+        await main()
+    finally:
+        await _close_session()
+
+
 if __name__ == '__main__':
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(_run())
\ No newline at end of file
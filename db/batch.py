@@ -0,0 +1,72 @@
+# db/batch.py - Coalescing bulk writer for expense inserts
+
+import asyncio
+import logging
+from bson import ObjectId
+from pymongo import InsertOne
+from pymongo.errors import BulkWriteError, WriteError
+
+from .client import expenses_col
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH_SIZE = 500
+MAX_BATCH_WAIT = 0.01  # seconds to wait for more inserts before flushing
+
+_insert_queue: asyncio.Queue | None = None
+_flusher_task: asyncio.Task | None = None
+
+
+async def _flush(batch):
+    """
+    Write one batch with a single unordered bulk_write and resolve
+    each caller's future with its inserted _id (or the error).
+    """
+    failed = {}
+    try:
+        await expenses_col.bulk_write([InsertOne(doc) for doc, _ in batch], ordered=False)
+    except BulkWriteError as e:
+        for err in e.details.get("writeErrors", []):
+            failed[err["index"]] = WriteError(err.get("errmsg"), err.get("code"), err)
+    except Exception as e:
+        logger.error(f"Bulk insert of {len(batch)} expenses failed: {e}")
+        failed = {i: e for i in range(len(batch))}
+
+    for i, (doc, fut) in enumerate(batch):
+        if fut.done():  # caller went away
+            continue
+        if i in failed:
+            fut.set_exception(failed[i])
+        else:
+            fut.set_result(doc["_id"])
+
+
+async def _flusher():
+    """
+    Drain the insert queue forever, coalescing everything that arrives
+    within MAX_BATCH_WAIT (up to MAX_BATCH_SIZE docs) into one write.
+    """
+    while True:
+        batch = [await _insert_queue.get()]
+        await asyncio.sleep(MAX_BATCH_WAIT)
+        while len(batch) < MAX_BATCH_SIZE and not _insert_queue.empty():
+            batch.append(_insert_queue.get_nowait())
+        await _flush(batch)
+
+
+async def insert_expense(doc):
+    """
+    Queue an expense document for the next bulk flush and wait for it.
+    Returns the inserted ObjectId.
+    """
+    global _insert_queue, _flusher_task
+
+    if _flusher_task is None or _flusher_task.done():
+        _insert_queue = asyncio.Queue()
+        _flusher_task = asyncio.create_task(_flusher())
+
+    # Assign the id up front so it is known without an insert result per doc
+    doc.setdefault("_id", ObjectId())
+    fut = asyncio.get_running_loop().create_future()
+    await _insert_queue.put((doc, fut))
+    return await fut
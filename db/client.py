@@ -1,12 +1,16 @@
 # db/client.py - MongoDB client and collection setup
 import os
 import certifi
+import logging
 import ssl
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from motor.motor_asyncio import AsyncIOMotorClient
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 MONGO_URI = os.getenv("MONGODB_URI")
 if not MONGO_URI:
     raise ValueError("Missing MONGODB_URI environment variable")
@@ -16,18 +20,40 @@ ssl_context = ssl.create_default_context(cafile=certifi.where())
 ssl_context.check_hostname = True
 ssl_context.verify_mode = ssl.CERT_REQUIRED
 
-# Configure connection with SSL certificate and proper pooling
+# Configure connection with SSL certificate and proper pooling.
+# One client per process: minPoolSize keeps warm sockets for tool bursts,
+# waitQueueTimeoutMS/serverSelectionTimeoutMS make saturation fail fast.
 client = AsyncIOMotorClient(
     MONGO_URI,
     tls=True,
     tlsCAFile=certifi.where(),
     tlsAllowInvalidCertificates=False,
     tlsAllowInvalidHostnames=False,
-    maxPoolSize=10,
-    minPoolSize=1,
-    serverSelectionTimeoutMS=30000,
+    maxPoolSize=200,
+    minPoolSize=20,
+    waitQueueTimeoutMS=5000,
+    serverSelectionTimeoutMS=2000,
     connectTimeoutMS=30000,
+    retryWrites=True,
+    compressors="zlib",
 )
 
 db = client["expense_tracker"]
 expenses_col = db["expenses"]
+groups_col = db["groups"]
+group_members_col = db["group_members"]
+users_col = db["users"]
+expense_participants_col = db["expense_participants"]
+
+
+@asynccontextmanager
+async def warm_pool_lifespan(server):
+    """
+    Server lifespan: ping MongoDB at startup so server selection and the
+    minPoolSize connections happen before the first tool call arrives.
+    """
+    try:
+        await client.admin.command("ping")
+    except Exception as e:
+        logger.warning(f"MongoDB warm-up ping failed: {e}")
+    yield
@@ -0,0 +1,42 @@
+# db/dates.py - Date parsing for BSON Date storage
+
+from datetime import datetime, timedelta, timezone
+
+# Accepted input formats, tried in order before falling back to ISO 8601
+DATE_FORMATS = ("%Y-%m-%d", "%d-%m-%Y")
+
+
+def parse_date(value) -> datetime:
+    """
+    Convert a user/LLM supplied date into a naive UTC datetime
+    so it is stored and compared as a BSON Date.
+    Accepts YYYY-MM-DD, DD-MM-YYYY or any ISO 8601 timestamp.
+    Raises ValueError for anything else, including non-string input.
+    """
+    if isinstance(value, datetime):
+        dt = value
+    elif not isinstance(value, str):
+        raise ValueError(f"Invalid date: {value!r}")
+    else:
+        value = value.strip()
+        for fmt in DATE_FORMATS:
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+        dt = datetime.fromisoformat(value)
+
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def day_range(start_date, end_date) -> tuple[datetime, datetime]:
+    """
+    Half-open [start, end) range covering whole days from start_date
+    through end_date. Rounding to day granularity keeps filters for the
+    same period identical, so query plans and cached results are reused.
+    """
+    start = parse_date(start_date).replace(hour=0, minute=0, second=0, microsecond=0)
+    end = parse_date(end_date).replace(hour=0, minute=0, second=0, microsecond=0)
+    return start, end + timedelta(days=1)
@@ -1,9 +1,11 @@
 # db/init.py - Hybrid schema initialisation + test write
 
-from .client import db, expenses_col
+from .client import db, expenses_col, group_members_col
 from .schema import expense_json_schema
-from datetime import datetime
+from datetime import datetime, timezone
+from pymongo import IndexModel
 from pymongo.errors import OperationFailure
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,9 +16,18 @@ async def setup_collection_hybrid():
     creates indexes, and performs test write.
     """
     cname = "expenses"
+    validator_options = {
+        "validator": {"$jsonSchema": expense_json_schema},
+        "validationLevel": "moderate",
+        "validationAction": "error"
+    }
     
     try:
-        existing = await db.list_collection_names()
+        # name -> collection options (includes the installed validator)
+        existing = {
+            c["name"]: c.get("options", {})
+            for c in await db.list_collections().to_list(None)
+        }
     except Exception as e:
         logger.error(f"Failed to list collections: {e}")
         raise
@@ -24,36 +35,77 @@ async def setup_collection_hybrid():
     # Create collection + validator if missing
     if cname not in existing:
         try:
-            await db.create_collection(
-                cname,
-                validator={"$jsonSchema": expense_json_schema},
-                validationLevel="moderate",
-                validationAction="error"
-            )
+            await db.create_collection(cname, **validator_options)
             print(f"[OK] Created '{cname}' with JSON-schema validator.")
         except Exception as e:
             await db.create_collection(cname)
             print(f"[OK] Created '{cname}' WITHOUT validator (provider restricted). Details: {e}")
 
+    elif all(existing[cname].get(k) == v for k, v in validator_options.items()):
+        print(f"[OK] Validator on '{cname}' already up to date.")
+
     else:
         # Try updating validator using collMod
         try:
-            await db.command({
-                "collMod": cname,
-                "validator": {"$jsonSchema": expense_json_schema},
-                "validationLevel": "moderate",
-                "validationAction": "error"
-            })
+            await db.command({"collMod": cname, **validator_options})
             print(f"[OK] Validator updated on existing collection '{cname}'.")
         except OperationFailure as e:
             print(f"[WARN] collMod restricted by cluster; continuing without update.")
         except Exception as e:
             print(f"[WARN] collMod error (ignored): {e}")
 
+    # Backfill: convert legacy string dates (ISO or DD-MM-YYYY) to BSON Date
+    try:
+        res = await expenses_col.update_many(
+            {"date": {"$type": "string"}},
+            [{"$set": {"date": {"$dateFromString": {
+                "dateString": "$date",
+                "onError": {"$dateFromString": {
+                    "dateString": "$date",
+                    "format": "%d-%m-%Y",
+                    "onError": "$date"
+                }}
+            }}}}]
+        )
+        if res.modified_count:
+            print(f"[OK] Migrated {res.modified_count} string dates to BSON Date.")
+    except Exception as e:
+        logger.warning(f"Date migration issue: {e}")
+
+    # Backfill: group_members.group_id and user_id are stored as ObjectId
+    # (legacy docs used strings)
+    for field in ("group_id", "user_id"):
+        try:
+            res = await group_members_col.update_many(
+                {field: {"$type": "string"}},
+                [{"$set": {field: {"$convert": {
+                    "input": f"${field}",
+                    "to": "objectId",
+                    "onError": f"${field}"
+                }}}}]
+            )
+            if res.modified_count:
+                print(f"[OK] Migrated {res.modified_count} membership {field}s to ObjectId.")
+        except Exception as e:
+            logger.warning(f"Membership {field} migration issue: {e}")
+
     # Indexes
     try:
-        await expenses_col.create_index([("date", -1)], name="idx_date_desc")
-        await expenses_col.create_index([("category", 1)], name="idx_category")
+        # One createIndexes command per collection, both in flight at once
+        await asyncio.gather(
+            expenses_col.create_indexes([
+                IndexModel([("date", -1)], name="idx_date_desc"),
+                IndexModel([("category", 1)], name="idx_category"),
+                IndexModel([("user_id", 1), ("date", -1)], name="idx_user_date"),
+                IndexModel([("user_id", 1), ("category", 1), ("date", -1)], name="idx_user_cat_date"),
+            ]),
+            group_members_col.create_indexes([
+                IndexModel([("user_id", 1), ("is_active", 1)], name="idx_member_user_active"),
+                IndexModel([("group_id", 1), ("is_active", 1)], name="idx_member_group_active"),
+                IndexModel([("group_id", 1), ("user_id", 1), ("is_active", 1)], name="idx_member_group_user_active"),
+                IndexModel([("group_id", 1), ("role", 1), ("is_active", 1)], name="idx_member_group_role_active"),
+            ])
+        )
         print("[OK] Indexes ensured.")
     except Exception as e:
         logger.warning(f"Index creation issue: {e}")
@@ -61,12 +113,12 @@ async def setup_collection_hybrid():
     # Test write (your SQLite WAL test equivalent)
     try:
         test_doc = {
-            "date": "2000-01-01",
+            "date": datetime(2000, 1, 1),
             "amount": 0,
             "category": "test",
             "subcategory": "",
             "note": "init-test",
-            "created_at": datetime.utcnow()
+            "created_at": datetime.now(timezone.utc)
         }
 
         inserted = await expenses_col.insert_one(test_doc)
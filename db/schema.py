@@ -5,8 +5,8 @@ expense_json_schema = {
     "required": ["date", "amount", "category"],
     "properties": {
         "date": {
-            "bsonType": "string",
-            "description": "Date string (prefer ISO format)"
+            "bsonType": "date",
+            "description": "Expense date (BSON Date, midnight UTC)"
         },
         "amount": {
             "bsonType": ["double", "int", "decimal"],
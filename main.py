@@ -1,11 +1,31 @@
 # main.py - FastMCP Expense Tracker server (Modular Architecture)
 
 from fastmcp import FastMCP
-from datetime import datetime
+from datetime import datetime, timezone
+from pymongo.errors import BulkWriteError, PyMongoError
 
-from db.client import expenses_col, client
+from db.client import expenses_col, client, warm_pool_lifespan
+from db.batch import insert_expense
+from db.dates import parse_date, day_range
+from cachetools import TTLCache
 
-mcp = FastMCP("ExpenseTracker")
+mcp = FastMCP("ExpenseTracker", lifespan=warm_pool_lifespan)
+
+# Fields returned by list_expenses unless the caller asks for others
+EXPENSE_LIST_FIELDS = ("date", "amount", "category", "subcategory", "note")
+
+# (start day, end day, category) -> summarize result; cleared on every write
+_summary_cache = TTLCache(maxsize=1024, ttl=60)
+
+# Bumped on every write. summarize only caches a result if no write
+# happened while it was aggregating.
+_summary_generation = 0
+
+def invalidate_summary_cache():
+    """Drop all cached summaries after an expense write"""
+    global _summary_generation
+    _summary_generation += 1
+    _summary_cache.clear()
 
 # -----------------------
 # Simple test tool
@@ -28,10 +48,7 @@ mcp = FastMCP("ExpenseTracker")
 # Utility: serialize Mongo docs
 # -----------------------
 def serialize(doc):
-    doc = dict(doc)
-    doc["id"] = str(doc["_id"])
-    del doc["_id"]
-    return doc
+    return {"id": str(doc["_id"]), **{k: v for k, v in doc.items() if k != "_id"}}
 
 # -----------------------
 # MCP TOOLS
@@ -40,39 +57,95 @@ def serialize(doc):
 async def add_expense(date: str, amount: float, category: str, subcategory: str = "", note: str = ""):
     """
     Add a new expense document.
+    date is YYYY-MM-DD (DD-MM-YYYY also accepted) and is stored as a BSON Date.
     Triggered by natural language: "Add milk expense for 8 rupees today"
     """
     try:
         doc = {
-            "date": date,
+            "date": parse_date(date),
             "amount": float(amount),
             "category": category,
             "subcategory": subcategory or "",
             "note": note or "",
-            "created_at": datetime.utcnow()
+            "created_at": datetime.now(timezone.utc)
         }
-        res = await expenses_col.insert_one(doc)
-        return {"status": "success", "id": str(res.inserted_id)}
-    except Exception as e:
+        inserted_id = await insert_expense(doc)
+        invalidate_summary_cache()
+        return {"status": "success", "id": str(inserted_id)}
+    except (PyMongoError, ValueError) as e:
+        return {"status": "error", "message": str(e)}
+
+@mcp.tool()
+async def add_expenses_bulk(items: list[dict]):
+    """
+    Add several expenses in one call. Prefer this over repeated add_expense
+    calls whenever the user lists more than one expense at once.
+    Each item needs date, amount and category; subcategory and note are optional.
+    Example prompt: "Add these: milk 8, bread 30, eggs 60 today"
+    """
+    try:
+        if not items:
+            return {"status": "error", "message": "At least one expense is required"}
+
+        now = datetime.now(timezone.utc)
+        docs = []
+        for i, item in enumerate(items):
+            missing = [f for f in ("date", "amount", "category") if item.get(f) in (None, "")]
+            if missing:
+                return {"status": "error", "message": f"Item {i} is missing: {', '.join(missing)}"}
+            if isinstance(item["amount"], bool) or not isinstance(item["amount"], (int, float, str)):
+                return {"status": "error", "message": f"Item {i} has an invalid amount"}
+            docs.append({
+                "date": parse_date(item["date"]),
+                "amount": float(item["amount"]),
+                "category": item["category"],
+                "subcategory": item.get("subcategory") or "",
+                "note": item.get("note") or "",
+                "created_at": now
+            })
+
+        # ordered=False keeps inserting past a rejected item, so a failure
+        # may still have written the rest; report both and never leave the
+        # cache stale
+        try:
+            res = await expenses_col.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            failed = {err["index"]: err.get("errmsg") for err in e.details.get("writeErrors", [])}
+            return {
+                "status": "error",
+                "message": f"{len(failed)} of {len(docs)} expenses failed to insert",
+                "ids": [str(d["_id"]) for i, d in enumerate(docs) if i not in failed],
+                "failed": [{"index": i, "message": msg} for i, msg in failed.items()]
+            }
+        finally:
+            invalidate_summary_cache()
+
+        return {"status": "success", "ids": [str(x) for x in res.inserted_ids]}
+    except (PyMongoError, ValueError) as e:
         return {"status": "error", "message": str(e)}
 
 @mcp.tool()
-async def list_expenses(start_date: str, end_date: str):
+async def list_expenses(start_date: str, end_date: str, limit: int = 1000, fields: list[str] | None = None):
     """
     List all expenses in the date range.
+    Returns at most `limit` (1-1000) expenses, newest first.
+    Pass `fields` to fetch columns in addition to the default
+    date/amount/category/subcategory/note (e.g. "created_at").
     Example prompt: "List my expenses from Jan 1 to Jan 10"
     """
     try:
-        cursor = expenses_col.find(
-            {"date": {"$gte": start_date, "$lte": end_date}}
-        ).sort([("date", -1), ("_id", -1)])
+        if not 1 <= limit <= 1000:
+            return {"status": "error", "message": "limit must be between 1 and 1000"}
 
-        output = []
-        async for doc in cursor:
-            output.append(serialize(doc))
+        start, end = day_range(start_date, end_date)
+        cursor = expenses_col.find(
+            {"date": {"$gte": start, "$lt": end}},
+            projection={f: 1 for f in (*EXPENSE_LIST_FIELDS, *(fields or ()))}
+        ).sort([("date", -1), ("_id", -1)]).limit(limit)
 
-        return output
-    except Exception as e:
+        docs = await cursor.to_list(length=limit)
+        return [serialize(d) for d in docs]
+    except (PyMongoError, ValueError) as e:
         return {"status": "error", "message": str(e)}
 
 @mcp.tool()
@@ -82,7 +155,13 @@ async def summarize(start_date: str, end_date: str, category: str = None):
     Example prompt: "Summarize my food expenses for this month"
     """
     try:
-        match = {"date": {"$gte": start_date, "$lte": end_date}}
+        start, end = day_range(start_date, end_date)
+        cache_key = (start, end, category or None)
+        if cache_key in _summary_cache:
+            return _summary_cache[cache_key]
+        generation = _summary_generation
+
+        match = {"date": {"$gte": start, "$lt": end}}
         if category:
             match["category"] = category
 
@@ -106,8 +185,11 @@ async def summarize(start_date: str, end_date: str, category: str = None):
                 "count": doc["count"]
             })
 
+        # A write during the aggregation may have made `out` stale
+        if _summary_generation == generation:
+            _summary_cache[cache_key] = out
         return out
-    except Exception as e:
+    except (PyMongoError, ValueError) as e:
         return {"status": "error", "message": str(e)}
 
 @mcp.tool()
@@ -119,5 +201,5 @@ async def setup_database():
     try:
         await setup_collection_hybrid()
         return {"status": "success", "message": "Database initialized successfully"}
-    except Exception as e:
+    except (PyMongoError, ValueError) as e:
         return {"status": "error", "message": str(e)}
@@ -4,9 +4,17 @@
 # Phase 2: Group Management and Member Management tools
 # Phase 3: Multi-User Expense Splitting
 
+import asyncio
+import logging
+import re
 from fastmcp import FastMCP
-from datetime import datetime
+from datetime import datetime, timezone
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import InsertOne
+from pymongo.errors import BulkWriteError, PyMongoError
+from cachetools import TTLCache
+from contextvars import ContextVar
 
 import sys
 import pathlib
@@ -20,25 +28,52 @@ from db.client import (
     group_members_col,
     expense_participants_col,
     users_col,
-    client
-)
-from server.utils.authorization import (
-    is_user_in_group,
-    is_user_group_admin,
-    get_user_by_email,
-    can_user_modify_group,
-    can_user_add_members,
-    can_user_remove_members,
-    get_group_member_count,
-    verify_group_exists
+    client,
+    warm_pool_lifespan
 )
+from db.batch import insert_expense
+from db.dates import parse_date, day_range
 from server.utils.splits import (
     calculate_splits,
     format_split_summary
 )
 from decimal import Decimal
 
-mcp = FastMCP("ExpenseTracker")
+mcp = FastMCP("ExpenseTracker", lifespan=warm_pool_lifespan)
+
+logger = logging.getLogger(__name__)
+
+# Fields returned by list_expenses unless the caller asks for others
+EXPENSE_LIST_FIELDS = ("date", "amount", "category", "subcategory", "note")
+
+# User fields shown next to members, payers and split participants
+USER_SUMMARY_FIELDS = {"email": 1, "full_name": 1}
+
+# Group fields that are internal bookkeeping and never returned to callers
+GROUP_HIDDEN_FIELDS = {"admin_version": 0}
+
+# Cursor bounds for group/membership reads: documents per batch, total cap
+GROUP_BATCH_SIZE = 200
+GROUP_QUERY_LIMIT = 2000
+
+# Shared error responses (returned as-is, never mutated)
+_ERR_INVALID_EXPENSE_ID = {"status": "error", "message": "Invalid expense ID format"}
+_ERR_EXPENSE_NOT_FOUND = {"status": "error", "message": "Expense not found or access denied"}
+
+# (user_id, start day, end day, category) -> summarize result
+_summary_cache = TTLCache(maxsize=1024, ttl=60)
+
+# user_id -> token replaced on every invalidation. summarize only caches a
+# result if the token it started with is still current; an evicted token
+# just skips caching, so the map can stay bounded like _summary_cache.
+_summary_generation = TTLCache(maxsize=1024, ttl=60)
+
+def invalidate_summary_cache(user_id: str):
+    """Drop cached summaries for a user after their expenses change"""
+    _summary_generation[user_id] = object()
+    for key in list(_summary_cache):
+        if key[0] == user_id:
+            _summary_cache.pop(key, None)
 
 # ============================================================================
 # UTILITY FUNCTIONS
@@ -46,18 +81,210 @@ mcp = FastMCP("ExpenseTracker")
 
 def serialize(doc):
     """Convert MongoDB document to JSON-serializable dict"""
-    doc = dict(doc)
-    doc["id"] = str(doc["_id"])
-    del doc["_id"]
-    return doc
+    return {"id": str(doc["_id"]), **{k: v for k, v in doc.items() if k != "_id"}}
+
+# Timestamp for the current tool call; each MCP request runs in its own task
+_request_now: ContextVar[datetime | None] = ContextVar("request_now", default=None)
+
+def _now() -> datetime:
+    """Current UTC time, read once per tool call and reused by all its writes"""
+    now = _request_now.get()
+    if now is None:
+        now = datetime.now(timezone.utc)
+        _request_now.set(now)
+    return now
+
+_OID_RE = re.compile(r"[0-9a-fA-F]{24}")
 
 def validate_object_id(id_str: str) -> bool:
-    """Check if string is a valid MongoDB ObjectId"""
-    try:
-        ObjectId(id_str)
-        return True
-    except Exception:
-        return False
+    """Check if string is a valid MongoDB ObjectId (24 hex chars)"""
+    return isinstance(id_str, str) and _OID_RE.fullmatch(id_str) is not None
+
+# ============================================================================
+# AUTHORIZATION CACHE
+# ============================================================================
+
+# (check name, user_id, group_id) -> bool. The short TTL bounds staleness
+# for changes made by other server instances.
+_auth_cache = TTLCache(maxsize=10000, ttl=30)
+
+# user_id -> {group_id: membership doc} for the current tool call. Each MCP
+# request is handled in its own task, so a context variable is request-scoped.
+_request_memberships: ContextVar[dict | None] = ContextVar("request_memberships", default=None)
+
+async def _get_memberships(user_id: str) -> dict:
+    """Load all of a user's active memberships once per request"""
+    cache = _request_memberships.get()
+    if cache is None:
+        cache = {}
+        _request_memberships.set(cache)
+    
+    if user_id not in cache:
+        # A malformed id cannot match any membership
+        if not validate_object_id(user_id):
+            return {}
+        # Uncapped: a missing membership would wrongly deny access
+        docs = await group_members_col.find(
+            {"user_id": ObjectId(user_id), "is_active": True},
+            projection={"group_id": 1, "role": 1}
+        ).batch_size(GROUP_BATCH_SIZE).to_list(None)
+        cache[user_id] = {str(m["group_id"]): m for m in docs}
+    return cache[user_id]
+
+async def _is_user_in_group(user_id: str, group_id: str) -> bool:
+    return group_id in await _get_memberships(user_id)
+
+async def _is_user_group_admin(user_id: str, group_id: str) -> bool:
+    membership = (await _get_memberships(user_id)).get(group_id)
+    return membership is not None and membership["role"] == "admin"
+
+async def _cached_auth(check, user_id: str, group_id: str) -> bool:
+    """Run an authorization check once per TTL window for the same user/group"""
+    key = (check.__name__, user_id, group_id)
+    result = _auth_cache.get(key)
+    if result is None:
+        result = await check(user_id, group_id)
+        _auth_cache[key] = result
+    return result
+
+async def is_user_in_group(user_id: str, group_id: str) -> bool:
+    return await _cached_auth(_is_user_in_group, user_id, group_id)
+
+async def is_user_group_admin(user_id: str, group_id: str) -> bool:
+    return await _cached_auth(_is_user_group_admin, user_id, group_id)
+
+# Modifying a group and managing its members are admin-only
+can_user_modify_group = is_user_group_admin
+can_user_add_members = is_user_group_admin
+can_user_remove_members = is_user_group_admin
+
+async def resolve_add_member_context(group_id: str, caller_id: str, email: str):
+    """
+    Resolve everything add_group_member needs in one aggregation:
+    the active group, the caller's membership, the user with `email`
+    and that user's existing active membership.
+    Returns None if the group does not exist or is inactive.
+    """
+    group_oid = ObjectId(group_id)
+    pipeline = [
+        {"$match": {"_id": group_oid, "is_active": True}},
+        {"$project": {"_id": 1}},
+        {"$lookup": {
+            "from": "group_members",
+            "pipeline": [
+                {"$match": {"group_id": group_oid, "user_id": ObjectId(caller_id), "is_active": True}},
+                {"$project": {"role": 1}}
+            ],
+            "as": "caller_membership"
+        }},
+        {"$lookup": {
+            "from": "users",
+            "pipeline": [
+                {"$match": {"email": email}},
+                {"$limit": 1},
+                {"$project": {"email": 1, "full_name": 1}}
+            ],
+            "as": "target_user"
+        }},
+        {"$set": {
+            "caller_membership": {"$first": "$caller_membership"},
+            "target_user": {"$first": "$target_user"}
+        }},
+        {"$lookup": {
+            "from": "group_members",
+            "localField": "target_user._id",
+            "foreignField": "user_id",
+            "pipeline": [
+                {"$match": {"group_id": group_oid, "is_active": True}},
+                {"$limit": 1},
+                {"$project": {"_id": 1}}
+            ],
+            "as": "existing_membership"
+        }},
+        {"$set": {"existing_membership": {"$first": "$existing_membership"}}}
+    ]
+    results = await groups_col.aggregate(pipeline).to_list(1)
+    return results[0] if results else None
+
+async def deactivate_membership(group_id: str, member_user_id: str) -> str:
+    """
+    Soft-delete an active membership, refusing to remove the group's last admin.
+    Returns "removed", "not_found" or "last_admin".
+    Non-admins are removed by one conditional find_one_and_update; admins
+    are removed in a transaction together with the remaining-admin check,
+    which requires MongoDB to run as a replica set.
+    """
+    if not validate_object_id(member_user_id):
+        return "not_found"
+    
+    group_oid = ObjectId(group_id)
+    query = {"group_id": group_oid, "user_id": ObjectId(member_user_id), "is_active": True}
+    leave = {"$set": {"is_active": False, "left_at": _now()}}
+    
+    if await group_members_col.find_one_and_update(
+        {**query, "role": {"$ne": "admin"}}, leave, projection={"_id": 1}
+    ):
+        return "removed"
+    
+    # Not an active non-admin: either an admin or not a member at all
+    async def remove_admin(session):
+        # Every admin removal writes the group document, so two concurrent
+        # removals conflict and one is retried instead of both seeing the
+        # other admin and leaving the group with none.
+        await groups_col.update_one(
+            {"_id": group_oid}, {"$inc": {"admin_version": 1}}, session=session
+        )
+        result = await group_members_col.update_one(
+            {**query, "role": "admin"}, leave, session=session
+        )
+        if result.matched_count == 0:
+            await session.abort_transaction()
+            return "not_found"
+        
+        if not await group_members_col.find_one(
+            {"group_id": group_oid, "role": "admin", "is_active": True},
+            projection={"_id": 1},
+            session=session
+        ):
+            await session.abort_transaction()
+            return "last_admin"
+        return "removed"
+    
+    async with await client.start_session() as session:
+        return await session.with_transaction(remove_admin)
+
+# Exact email -> user summary. Keys are case-sensitive, matching the users
+# query and add_group_member. Only hits are cached; a stale entry is
+# harmless because membership inserts still reference the user's _id.
+_user_email_cache = TTLCache(maxsize=1024, ttl=60)
+
+async def get_users_by_email(emails: list[str]) -> dict:
+    """Map each known email to its user summary, querying only cache misses"""
+    found = {}
+    misses = []
+    for email in emails:
+        user = _user_email_cache.get(email)
+        if user is None:
+            misses.append(email)
+        else:
+            found[email] = user
+    
+    if misses:
+        users = await users_col.find(
+            {"email": {"$in": misses}},
+            projection=USER_SUMMARY_FIELDS
+        ).to_list(len(misses))
+        for user in users:
+            _user_email_cache[user["email"]] = user
+            found[user["email"]] = user
+    return found
+
+def invalidate_auth_cache(group_id: str, user_id: str = None):
+    """Drop cached decisions for a group, optionally only for one user"""
+    _request_memberships.set(None)
+    for key in list(_auth_cache):
+        if key[2] == group_id and (user_id is None or key[1] == user_id):
+            _auth_cache.pop(key, None)
 
 # ============================================================================
 # PHASE 0 & 1: EXPENSE MANAGEMENT (Backward Compatible)
@@ -67,6 +294,7 @@ def validate_object_id(id_str: str) -> bool:
 async def add_expense(user_id: str, date: str, amount: float, category: str, subcategory: str = "", note: str = ""):
     """
     Add a new expense document for authenticated user.
+    date is YYYY-MM-DD (DD-MM-YYYY also accepted) and is stored as a BSON Date.
     user_id is automatically injected by FastAPI gateway.
     
     Phase 0: Personal expenses
@@ -75,38 +303,95 @@ async def add_expense(user_id: str, date: str, amount: float, category: str, sub
     try:
         doc = {
             "user_id": user_id,
-            "date": date,
+            "date": parse_date(date),
             "amount": float(amount),
             "category": category,
             "subcategory": subcategory or "",
             "note": note or "",
-            "created_at": datetime.utcnow()
+            "created_at": _now()
         }
-        res = await expenses_col.insert_one(doc)
-        return {"status": "success", "id": str(res.inserted_id)}
-    except Exception as e:
+        inserted_id = await insert_expense(doc)
+        invalidate_summary_cache(user_id)
+        return {"status": "success", "id": str(inserted_id)}
+    except (PyMongoError, ValueError) as e:
         return {"status": "error", "message": str(e)}
 
 @mcp.tool()
-async def list_expenses(user_id: str, start_date: str, end_date: str):
+async def add_expenses_bulk(user_id: str, items: list[dict]):
+    """
+    Add several expenses in one call. Prefer this over repeated add_expense
+    calls whenever the user lists more than one expense at once.
+    Each item needs date, amount and category; subcategory and note are optional.
+    user_id is automatically injected by FastAPI gateway.
+    Example prompt: "Add these: milk 8, bread 30, eggs 60 today"
+    """
+    try:
+        if not items:
+            return {"status": "error", "message": "At least one expense is required"}
+        
+        now = _now()
+        docs = []
+        for i, item in enumerate(items):
+            missing = [f for f in ("date", "amount", "category") if item.get(f) in (None, "")]
+            if missing:
+                return {"status": "error", "message": f"Item {i} is missing: {', '.join(missing)}"}
+            if isinstance(item["amount"], bool) or not isinstance(item["amount"], (int, float, str)):
+                return {"status": "error", "message": f"Item {i} has an invalid amount"}
+            docs.append({
+                "user_id": user_id,
+                "date": parse_date(item["date"]),
+                "amount": float(item["amount"]),
+                "category": item["category"],
+                "subcategory": item.get("subcategory") or "",
+                "note": item.get("note") or "",
+                "created_at": now
+            })
+        
+        # ordered=False keeps inserting past a rejected item, so a failure
+        # may still have written the rest; report both and never leave the
+        # cache stale
+        try:
+            res = await expenses_col.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            failed = {err["index"]: err.get("errmsg") for err in e.details.get("writeErrors", [])}
+            return {
+                "status": "error",
+                "message": f"{len(failed)} of {len(docs)} expenses failed to insert",
+                "ids": [str(d["_id"]) for i, d in enumerate(docs) if i not in failed],
+                "failed": [{"index": i, "message": msg} for i, msg in failed.items()]
+            }
+        finally:
+            invalidate_summary_cache(user_id)
+        
+        return {"status": "success", "ids": [str(x) for x in res.inserted_ids]}
+    except (PyMongoError, ValueError) as e:
+        return {"status": "error", "message": str(e)}
+
+@mcp.tool()
+async def list_expenses(user_id: str, start_date: str, end_date: str, limit: int = 1000, fields: list[str] | None = None):
     """
     List all expenses for authenticated user in date range.
+    Returns at most `limit` (1-1000) expenses, newest first.
+    Pass `fields` to fetch columns in addition to the default
+    date/amount/category/subcategory/note (e.g. "created_at").
     user_id is automatically injected by FastAPI gateway.
     """
     try:
+        if not 1 <= limit <= 1000:
+            return {"status": "error", "message": "limit must be between 1 and 1000"}
+
+        start, end = day_range(start_date, end_date)
         cursor = expenses_col.find(
             {
                 "user_id": user_id,
-                "date": {"$gte": start_date, "$lte": end_date}
-            }
-        ).sort([("date", -1), ("_id", -1)])
-
-        output = []
-        async for doc in cursor:
-            output.append(serialize(doc))
+                "date": {"$gte": start, "$lt": end}
+            },
+            projection={f: 1 for f in (*EXPENSE_LIST_FIELDS, *(fields or ()))}
+        ).sort([("date", -1), ("_id", -1)]).limit(limit)
 
-        return output
-    except Exception as e:
+        docs = await cursor.to_list(length=limit)
+        return [serialize(d) for d in docs]
+    except (PyMongoError, ValueError) as e:
         return {"status": "error", "message": str(e)}
 
 @mcp.tool()
@@ -116,9 +401,15 @@ async def summarize(user_id: str, start_date: str, end_date: str, category: str
     user_id is automatically injected by FastAPI gateway.
     """
     try:
+        start, end = day_range(start_date, end_date)
+        cache_key = (user_id, start, end, category or None)
+        if cache_key in _summary_cache:
+            return _summary_cache[cache_key]
+        generation = _summary_generation.setdefault(user_id, object())
+
         match = {
             "user_id": user_id,
-            "date": {"$gte": start_date, "$lte": end_date}
+            "date": {"$gte": start, "$lt": end}
         }
         if category:
             match["category"] = category
@@ -143,8 +434,11 @@ async def summarize(user_id: str, start_date: str, end_date: str, category: str
                 "count": doc["count"]
             })
 
+        # A write during the aggregation may have made `out` stale
+        if _summary_generation.get(user_id) is generation:
+            _summary_cache[cache_key] = out
         return out
-    except Exception as e:
+    except (PyMongoError, ValueError) as e:
         return {"status": "error", "message": str(e)}
 
 @mcp.tool()
@@ -154,19 +448,24 @@ async def delete_expense(user_id: str, expense_id: str):
     user_id is automatically injected by FastAPI gateway.
     """
     try:
-        if not validate_object_id(expense_id):
-            return {"status": "error", "message": "Invalid expense ID format"}
+        try:
+            expense_oid = ObjectId(expense_id)
+        except InvalidId:
+            return _ERR_INVALID_EXPENSE_ID
         
+        # _id is unique, so this is one _id index seek; user_id is checked
+        # on that single document (no extra index needed)
         result = await expenses_col.delete_one({
-            "_id": ObjectId(expense_id),
+            "_id": expense_oid,
             "user_id": user_id  # Ensure user can only delete their own expenses
         })
         
         if result.deleted_count == 0:
-            return {"status": "error", "message": "Expense not found or access denied"}
+            return _ERR_EXPENSE_NOT_FOUND
+        invalidate_summary_cache(user_id)
         
         return {"status": "success", "message": "Expense deleted"}
-    except Exception as e:
+    except (PyMongoError, ValueError) as e:
         return {"status": "error", "message": str(e)}
 
 # ============================================================================
@@ -199,30 +498,42 @@ async def create_group(user_id: str, name: str, description: str = ""):
         if len(description) > 500:
             return {"status": "error", "message": "Description must be 500 characters or less"}
         
-        # Create group document
+        if not validate_object_id(user_id):
+            return {"status": "error", "message": "Invalid user ID format"}
+        creator_oid = ObjectId(user_id)
+        
+        now = _now()
+        
+        # Create group document (updated_at is only set by real updates)
         group_doc = {
             "name": name.strip(),
             "description": description.strip() if description else "",
             "created_by": user_id,
             "is_active": True,
             "group_type": "shared",  # Phase 2: Only shared groups (personal groups created by migration)
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
+            "created_at": now
         }
         
-        # Insert group
+        # Insert the group before its admin membership so a membership
+        # never points at a group that failed to insert
         result = await groups_col.insert_one(group_doc)
-        group_id = str(result.inserted_id)
+        group_oid = result.inserted_id
+        group_id = str(group_oid)
         
         # Add creator as admin member
         member_doc = {
-            "group_id": group_id,
-            "user_id": user_id,
+            "group_id": group_oid,
+            "user_id": creator_oid,
             "role": "admin",
             "is_active": True,
-            "joined_at": datetime.utcnow()
+            "joined_at": now
         }
-        await group_members_col.insert_one(member_doc)
+        try:
+            await group_members_col.insert_one(member_doc)
+        except PyMongoError:
+            # Don't leave behind a group nobody can manage
+            await groups_col.delete_one({"_id": group_oid})
+            raise
         
         # Return created group
         group_doc["id"] = group_id
@@ -235,8 +546,9 @@ async def create_group(user_id: str, name: str, description: str = ""):
             "message": f"Group '{name}' created successfully"
         }
         
-    except Exception as e:
-        return {"status": "error", "message": f"Failed to create group: {str(e)}"}
+    except (PyMongoError, InvalidId, ValueError) as e:
+        logger.exception("Failed to create group")
+        return {"status": "error", "message": f"Failed to create group: {e}"}
 
 @mcp.tool()
 async def list_groups(user_id: str):
@@ -248,38 +560,46 @@ async def list_groups(user_id: str):
         
     Returns:
         List of groups with member count and user's role
+        (at most 2000 groups)
     """
     try:
         # Get all active memberships
-        memberships = await group_members_col.find({
-            "user_id": user_id,
-            "is_active": True
-        }).to_list(None)
+        memberships = await group_members_col.find(
+            {"user_id": ObjectId(user_id), "is_active": True},
+            projection={"group_id": 1, "role": 1}
+        ).batch_size(GROUP_BATCH_SIZE).to_list(GROUP_QUERY_LIMIT)
         
         if not memberships:
             return []
         
         # Get group IDs
-        group_ids = [ObjectId(m["group_id"]) for m in memberships]
-        
-        # Get groups
-        groups = await groups_col.find({
-            "_id": {"$in": group_ids},
-            "is_active": True
-        }).to_list(None)
+        group_ids = [m["group_id"] for m in memberships]
+        
+        # Get groups and member counts (one $group aggregation) concurrently
+        groups, counts = await asyncio.gather(
+            groups_col.find(
+                {"_id": {"$in": group_ids}, "is_active": True},
+                projection=GROUP_HIDDEN_FIELDS
+            ).batch_size(GROUP_BATCH_SIZE).to_list(GROUP_QUERY_LIMIT),
+            group_members_col.aggregate([
+                {"$match": {
+                    "group_id": {"$in": group_ids},
+                    "is_active": True
+                }},
+                {"$group": {"_id": "$group_id", "count": {"$sum": 1}}}
+            ]).to_list(None)
+        )
         
-        # Create role lookup
+        # Create role and member count lookups
         role_map = {m["group_id"]: m["role"] for m in memberships}
+        count_map = {c["_id"]: c["count"] for c in counts}
         
         # Enrich groups with member count and role
         result = []
         for group in groups:
-            group_id = str(group["_id"])
-            member_count = await get_group_member_count(group_id)
-            
             group_data = serialize(group)
-            group_data["member_count"] = member_count
-            group_data["your_role"] = role_map.get(group_id, "member")
+            group_data["member_count"] = count_map.get(group["_id"], 0)
+            group_data["your_role"] = role_map.get(group["_id"], "member")
             
             result.append(group_data)
         
@@ -288,8 +608,9 @@ async def list_groups(user_id: str):
         
         return result
         
-    except Exception as e:
-        return {"status": "error", "message": f"Failed to list groups: {str(e)}"}
+    except (PyMongoError, InvalidId, ValueError) as e:
+        logger.exception("Failed to list groups")
+        return {"status": "error", "message": f"Failed to list groups: {e}"}
 
 @mcp.tool()
 async def get_group_details(user_id: str, group_id: str):
@@ -302,7 +623,9 @@ async def get_group_details(user_id: str, group_id: str):
         group_id: Group ID to retrieve
         
     Returns:
-        Group details with list of members
+        Group details with list of members. At most 2000 members are listed;
+        member_count is always the full count and members_truncated tells
+        whether the list was cut short (use get_group_members to page).
     """
     try:
         # Validate group_id format
@@ -313,53 +636,73 @@ async def get_group_details(user_id: str, group_id: str):
         if not await is_user_in_group(user_id, group_id):
             return {"status": "error", "message": "Access denied: You are not a member of this group"}
         
-        # Get group
-        group = await groups_col.find_one({
-            "_id": ObjectId(group_id),
-            "is_active": True
-        })
+        # Members come back sorted (admins first, then by join date) and
+        # joined with their user documents by the server
+        group_oid = ObjectId(group_id)
+        pipeline = [
+            {"$match": {"group_id": group_oid, "is_active": True}},
+            {"$addFields": {
+                "_admin_rank": {"$cond": [{"$eq": ["$role", "admin"]}, 0, 1]}
+            }},
+            {"$sort": {"_admin_rank": 1, "joined_at": 1}},
+            {"$limit": GROUP_QUERY_LIMIT},
+            {"$lookup": {
+                "from": "users",
+                "localField": "user_id",
+                "foreignField": "_id",
+                "pipeline": [{"$project": {"email": 1, "full_name": 1}}],
+                "as": "user"
+            }},
+            {"$project": {
+                "_id": 0,
+                "user_id": {"$toString": "$user_id"},
+                "role": 1,
+                "joined_at": 1,
+                "user": {"$first": "$user"}
+            }}
+        ]
+        
+        # Get group, members, the full member count and the caller's
+        # memberships concurrently
+        group, memberships, member_count, my_memberships = await asyncio.gather(
+            groups_col.find_one(
+                {"_id": group_oid, "is_active": True},
+                projection=GROUP_HIDDEN_FIELDS
+            ),
+            group_members_col.aggregate(pipeline, batchSize=GROUP_BATCH_SIZE).to_list(GROUP_QUERY_LIMIT),
+            group_members_col.count_documents({"group_id": group_oid, "is_active": True}),
+            _get_memberships(user_id)
+        )
         
         if not group:
             return {"status": "error", "message": "Group not found"}
         
-        # Get members
-        memberships = await group_members_col.find({
-            "group_id": group_id,
-            "is_active": True
-        }).to_list(None)
-        
-        # Get user details for members
-        user_ids = [ObjectId(m["user_id"]) for m in memberships]
-        users = await users_col.find({"_id": {"$in": user_ids}}).to_list(None)
-        user_map = {str(u["_id"]): u for u in users}
-        
         # Build member list
         members = []
         for membership in memberships:
-            uid = membership["user_id"]
-            user = user_map.get(uid, {})
+            user = membership.get("user") or {}
             
             members.append({
-                "user_id": uid,
+                "user_id": membership["user_id"],
                 "email": user.get("email", "Unknown"),
                 "full_name": user.get("full_name", "Unknown User"),
                 "role": membership["role"],
-                "joined_at": membership["joined_at"].isoformat() if membership.get("joined_at") else None
+                "joined_at": membership.get("joined_at")
             })
         
-        # Sort members: admins first, then by join date
-        members.sort(key=lambda m: (m["role"] != "admin", m.get("joined_at", "")))
-        
         # Prepare response
         group_data = serialize(group)
         group_data["members"] = members
-        group_data["member_count"] = len(members)
-        group_data["your_role"] = next((m["role"] for m in members if m["user_id"] == user_id), "member")
+        group_data["member_count"] = member_count
+        group_data["members_truncated"] = len(members) < member_count
+        # From the caller's own memberships, since a truncated list may omit them
+        group_data["your_role"] = my_memberships.get(group_id, {}).get("role", "member")
         
         return group_data
         
-    except Exception as e:
-        return {"status": "error", "message": f"Failed to get group details: {str(e)}"}
+    except (PyMongoError, InvalidId, ValueError) as e:
+        logger.exception("Failed to get group details")
+        return {"status": "error", "message": f"Failed to get group details: {e}"}
 
 @mcp.tool()
 async def update_group(user_id: str, group_id: str, name: str = None, description: str = None):
@@ -385,12 +728,8 @@ async def update_group(user_id: str, group_id: str, name: str = None, descriptio
         if not await can_user_modify_group(user_id, group_id):
             return {"status": "error", "message": "Access denied: Only admins can update group details"}
         
-        # Check if group exists
-        if not await verify_group_exists(group_id):
-            return {"status": "error", "message": "Group not found"}
-        
         # Build update document
-        update_doc = {"updated_at": datetime.utcnow()}
+        update_doc = {"updated_at": _now()}
         
         if name is not None:
             if len(name.strip()) == 0:
@@ -405,21 +744,25 @@ async def update_group(user_id: str, group_id: str, name: str = None, descriptio
             update_doc["description"] = description.strip()
         
         # Check if any personal group (cannot be updated)
-        group = await groups_col.find_one({"_id": ObjectId(group_id)})
+        group = await groups_col.find_one({"_id": ObjectId(group_id)}, projection={"group_type": 1})
         if group and group.get("group_type") == "personal":
             return {"status": "error", "message": "Cannot update personal groups"}
         
-        # Update group
+        # Update group. The admin check may come from the auth cache, so
+        # the filter itself makes sure the group has not been deleted.
         result = await groups_col.update_one(
-            {"_id": ObjectId(group_id)},
+            {"_id": ObjectId(group_id), "is_active": True},
             {"$set": update_doc}
         )
         
+        if result.matched_count == 0:
+            return {"status": "error", "message": "Group not found"}
+        
         if result.modified_count == 0:
             return {"status": "error", "message": "No changes made"}
         
         # Get updated group
-        updated_group = await groups_col.find_one({"_id": ObjectId(group_id)})
+        updated_group = await groups_col.find_one({"_id": ObjectId(group_id)}, projection=GROUP_HIDDEN_FIELDS)
         
         return {
             "status": "success",
@@ -427,8 +770,9 @@ async def update_group(user_id: str, group_id: str, name: str = None, descriptio
             "group": serialize(updated_group)
         }
         
-    except Exception as e:
-        return {"status": "error", "message": f"Failed to update group: {str(e)}"}
+    except (PyMongoError, InvalidId, ValueError) as e:
+        logger.exception("Failed to update group")
+        return {"status": "error", "message": f"Failed to update group: {e}"}
 
 @mcp.tool()
 async def delete_group(user_id: str, group_id: str):
@@ -454,7 +798,10 @@ async def delete_group(user_id: str, group_id: str):
             return {"status": "error", "message": "Access denied: Only admins can delete groups"}
         
         # Get group
-        group = await groups_col.find_one({"_id": ObjectId(group_id), "is_active": True})
+        group = await groups_col.find_one(
+            {"_id": ObjectId(group_id), "is_active": True},
+            projection={"group_type": 1, "name": 1}
+        )
         
         if not group:
             return {"status": "error", "message": "Group not found"}
@@ -463,25 +810,28 @@ async def delete_group(user_id: str, group_id: str):
         if group.get("group_type") == "personal":
             return {"status": "error", "message": "Cannot delete personal groups"}
         
-        # Soft delete group
-        await groups_col.update_one(
-            {"_id": ObjectId(group_id)},
-            {"$set": {"is_active": False, "updated_at": datetime.utcnow()}}
-        )
-        
-        # Deactivate all memberships
-        await group_members_col.update_many(
-            {"group_id": group_id, "is_active": True},
-            {"$set": {"is_active": False, "left_at": datetime.utcnow()}}
+        # Soft delete group and deactivate all memberships concurrently
+        now = _now()
+        await asyncio.gather(
+            groups_col.update_one(
+                {"_id": ObjectId(group_id)},
+                {"$set": {"is_active": False, "updated_at": now}}
+            ),
+            group_members_col.update_many(
+                {"group_id": ObjectId(group_id), "is_active": True},
+                {"$set": {"is_active": False, "left_at": now}}
+            )
         )
+        invalidate_auth_cache(group_id)
         
         return {
             "status": "success",
             "message": f"Group '{group['name']}' deleted successfully"
         }
         
-    except Exception as e:
-        return {"status": "error", "message": f"Failed to delete group: {str(e)}"}
+    except (PyMongoError, InvalidId, ValueError) as e:
+        logger.exception("Failed to delete group")
+        return {"status": "error", "message": f"Failed to delete group: {e}"}
 
 # ============================================================================
 # PHASE 2: GROUP MEMBER MANAGEMENT
@@ -513,41 +863,39 @@ async def add_group_member(user_id: str, group_id: str, member_email: str, role:
         if role not in ["admin", "member"]:
             return {"status": "error", "message": "Role must be 'admin' or 'member'"}
         
+        # Group, caller role, target user and existing membership in one round-trip.
+        # A missing/inactive group has no active admins, so it is reported as
+        # access denied, as before.
+        ctx = await resolve_add_member_context(group_id, user_id, member_email)
+        
         # Check if requesting user can add members
-        if not await can_user_add_members(user_id, group_id):
+        caller = ctx.get("caller_membership") if ctx else None
+        if not caller or caller.get("role") != "admin":
             return {"status": "error", "message": "Access denied: Only admins can add members"}
         
-        # Check if group exists
-        if not await verify_group_exists(group_id):
-            return {"status": "error", "message": "Group not found"}
-        
         # Find user by email
-        new_user = await get_user_by_email(member_email)
+        new_user = ctx.get("target_user")
         if not new_user:
             return {"status": "error", "message": f"User with email '{member_email}' not found"}
         
         new_user_id = str(new_user["_id"])
+        _user_email_cache[new_user["email"]] = new_user
         
         # Check if already a member
-        existing_member = await group_members_col.find_one({
-            "group_id": group_id,
-            "user_id": new_user_id,
-            "is_active": True
-        })
-        
-        if existing_member:
+        if ctx.get("existing_membership"):
             return {"status": "error", "message": "User is already a member of this group"}
         
         # Add member
         member_doc = {
-            "group_id": group_id,
-            "user_id": new_user_id,
+            "group_id": ObjectId(group_id),
+            "user_id": new_user["_id"],
             "role": role,
             "is_active": True,
-            "joined_at": datetime.utcnow()
+            "joined_at": _now()
         }
         
         await group_members_col.insert_one(member_doc)
+        invalidate_auth_cache(group_id, new_user_id)
         
         return {
             "status": "success",
@@ -560,8 +908,122 @@ async def add_group_member(user_id: str, group_id: str, member_email: str, role:
             }
         }
         
-    except Exception as e:
-        return {"status": "error", "message": f"Failed to add member: {str(e)}"}
+    except (PyMongoError, InvalidId, ValueError) as e:
+        logger.exception("Failed to add member")
+        return {"status": "error", "message": f"Failed to add member: {e}"}
+
+@mcp.tool()
+async def add_group_members(user_id: str, group_id: str, member_emails: list[str], role: str = "member"):
+    """
+    Add several members to a group in one call.
+    Only admins can add members. Prefer this over repeated add_group_member
+    calls when inviting more than one person.
+    
+    Args:
+        user_id: User ID (injected by FastAPI)
+        group_id: Group ID
+        member_emails: Emails of users to add
+        role: Role for the new members ("admin" or "member", default "member")
+        
+    Returns:
+        Added members plus the emails that were skipped and why
+    """
+    try:
+        # Validate inputs
+        if not validate_object_id(group_id):
+            return {"status": "error", "message": "Invalid group ID format"}
+        
+        entries = [(e or "").strip() for e in member_emails]
+        emails = list(dict.fromkeys(e for e in entries if "@" in e))
+        invalid = list(dict.fromkeys(e for e in entries if "@" not in e))
+        if not emails:
+            return {"status": "error", "message": "At least one valid email address required", "invalid": invalid}
+        
+        if role not in ["admin", "member"]:
+            return {"status": "error", "message": "Role must be 'admin' or 'member'"}
+        
+        # Check if user can add members
+        if not await can_user_add_members(user_id, group_id):
+            return {"status": "error", "message": "Access denied: Only admins can add members"}
+        
+        group_oid = ObjectId(group_id)
+        
+        # The admin check may come from the auth cache, so confirm the group
+        # is still active while resolving all emails (cached, then one query
+        # for the misses)
+        group, users_by_email = await asyncio.gather(
+            groups_col.find_one({"_id": group_oid, "is_active": True}, projection={"_id": 1}),
+            get_users_by_email(emails)
+        )
+        if not group:
+            return {"status": "error", "message": "Group not found"}
+        
+        user_by_id = {str(u["_id"]): u for u in users_by_email.values()}
+        
+        # Filter out existing members in one query
+        existing = {
+            str(m["user_id"]) for m in await group_members_col.find(
+                {
+                    "group_id": group_oid,
+                    "user_id": {"$in": [u["_id"] for u in user_by_id.values()]},
+                    "is_active": True
+                },
+                projection={"user_id": 1}
+            ).to_list(None)
+        }
+        new_ids = [uid for uid in user_by_id if uid not in existing]
+        
+        # Insert all new memberships in one round-trip. ordered=False keeps
+        # inserting past a rejected membership, so a failure may still have
+        # added the rest; report both and always drop cached auth decisions
+        now = _now()
+        failed = {}
+        if new_ids:
+            try:
+                await group_members_col.bulk_write([
+                    InsertOne({
+                        "group_id": group_oid,
+                        "user_id": user_by_id[uid]["_id"],
+                        "role": role,
+                        "is_active": True,
+                        "joined_at": now
+                    })
+                    for uid in new_ids
+                ], ordered=False)
+            except BulkWriteError as e:
+                failed = {new_ids[err["index"]]: err.get("errmsg") for err in e.details.get("writeErrors", [])}
+            finally:
+                for uid in new_ids:
+                    invalidate_auth_cache(group_id, uid)
+        added_ids = [uid for uid in new_ids if uid not in failed]
+        message = f"Added {len(added_ids)} member(s) to group as {role}"
+        if failed:
+            message += f"; {len(failed)} failed to insert"
+        
+        return {
+            "status": "error" if failed else "success",
+            "message": message,
+            "added": [
+                {
+                    "user_id": uid,
+                    "email": user_by_id[uid].get("email"),
+                    "full_name": user_by_id[uid].get("full_name", "Unknown User"),
+                    "role": role
+                }
+                for uid in added_ids
+            ],
+            "failed": [
+                {"email": user_by_id[uid].get("email"), "message": msg}
+                for uid, msg in failed.items()
+            ],
+            "already_members": [user_by_id[uid].get("email") for uid in existing],
+            "not_found": [e for e in emails if e not in users_by_email],
+            "invalid": invalid
+        }
+        
+    except (PyMongoError, InvalidId, ValueError) as e:
+        logger.exception("Failed to add members")
+        return {"status": "error", "message": f"Failed to add members: {e}"}
 
 @mcp.tool()
 async def remove_group_member(user_id: str, group_id: str, member_user_id: str):
@@ -569,6 +1031,7 @@ async def remove_group_member(user_id: str, group_id: str, member_user_id: str):
     Remove a member from a group.
     Only admins can remove members.
     Cannot remove yourself or the last admin.
+    Removing an admin uses a transaction, so MongoDB must run as a replica set.
     
     Args:
         user_id: User ID (injected by FastAPI)
@@ -591,35 +1054,19 @@ async def remove_group_member(user_id: str, group_id: str, member_user_id: str):
         if member_user_id == user_id:
             return {"status": "error", "message": "Cannot remove yourself. Use leave_group instead"}
         
-        # Check if member exists
-        member = await group_members_col.find_one({
-            "group_id": group_id,
-            "user_id": member_user_id,
-            "is_active": True
-        })
+        # Remove member (soft delete), unless it is the last admin
+        outcome = await deactivate_membership(group_id, member_user_id)
         
-        if not member:
+        if outcome == "not_found":
             return {"status": "error", "message": "Member not found in this group"}
         
-        # Check if removing last admin
-        if member["role"] == "admin":
-            admin_count = await group_members_col.count_documents({
-                "group_id": group_id,
-                "role": "admin",
-                "is_active": True
-            })
-            
-            if admin_count <= 1:
-                return {"status": "error", "message": "Cannot remove the last admin. Promote another member first"}
+        if outcome == "last_admin":
+            return {"status": "error", "message": "Cannot remove the last admin. Promote another member first"}
         
-        # Remove member (soft delete)
-        await group_members_col.update_one(
-            {"_id": member["_id"]},
-            {"$set": {"is_active": False, "left_at": datetime.utcnow()}}
-        )
+        invalidate_auth_cache(group_id, member_user_id)
         
         # Get user details for response
-        user = await users_col.find_one({"_id": ObjectId(member_user_id)})
+        user = await users_col.find_one({"_id": ObjectId(member_user_id)}, projection={"email": 1})
         user_email = user.get("email", "Unknown") if user else "Unknown"
         
         return {
@@ -627,8 +1074,9 @@ async def remove_group_member(user_id: str, group_id: str, member_user_id: str):
             "message": f"Member '{user_email}' removed from group"
         }
         
-    except Exception as e:
-        return {"status": "error", "message": f"Failed to remove member: {str(e)}"}
+    except (PyMongoError, InvalidId, ValueError) as e:
+        logger.exception("Failed to remove member")
+        return {"status": "error", "message": f"Failed to remove member: {e}"}
 
 @mcp.tool()
 async def leave_group(user_id: str, group_id: str):
@@ -636,6 +1084,7 @@ async def leave_group(user_id: str, group_id: str):
     Leave a group.
     Cannot leave personal groups.
     If last admin, must promote someone else first.
+    Leaving as an admin uses a transaction, so MongoDB must run as a replica set.
     
     Args:
         user_id: User ID (injected by FastAPI)
@@ -650,17 +1099,11 @@ async def leave_group(user_id: str, group_id: str):
             return {"status": "error", "message": "Invalid group ID format"}
         
         # Check if member of group
-        member = await group_members_col.find_one({
-            "group_id": group_id,
-            "user_id": user_id,
-            "is_active": True
-        })
-        
-        if not member:
+        if not await is_user_in_group(user_id, group_id):
             return {"status": "error", "message": "You are not a member of this group"}
         
         # Get group
-        group = await groups_col.find_one({"_id": ObjectId(group_id)})
+        group = await groups_col.find_one({"_id": ObjectId(group_id)}, projection={"group_type": 1, "name": 1})
         
         if not group:
             return {"status": "error", "message": "Group not found"}
@@ -669,33 +1112,28 @@ async def leave_group(user_id: str, group_id: str):
         if group.get("group_type") == "personal":
             return {"status": "error", "message": "Cannot leave personal groups"}
         
-        # If admin, check if last admin
-        if member["role"] == "admin":
-            admin_count = await group_members_col.count_documents({
-                "group_id": group_id,
-                "role": "admin",
-                "is_active": True
-            })
-            
-            if admin_count <= 1:
-                return {"status": "error", "message": "Cannot leave: You are the last admin. Promote another member or delete the group"}
+        # Leave group, unless you are the last admin
+        outcome = await deactivate_membership(group_id, user_id)
         
-        # Leave group
-        await group_members_col.update_one(
-            {"_id": member["_id"]},
-            {"$set": {"is_active": False, "left_at": datetime.utcnow()}}
-        )
+        if outcome == "not_found":
+            return {"status": "error", "message": "You are not a member of this group"}
+        
+        if outcome == "last_admin":
+            return {"status": "error", "message": "Cannot leave: You are the last admin. Promote another member or delete the group"}
+        
+        invalidate_auth_cache(group_id, user_id)
         
         return {
             "status": "success",
             "message": f"You have left the group '{group['name']}'"
         }
         
-    except Exception as e:
-        return {"status": "error", "message": f"Failed to leave group: {str(e)}"}
+    except (PyMongoError, InvalidId, ValueError) as e:
+        logger.exception("Failed to leave group")
+        return {"status": "error", "message": f"Failed to leave group: {e}"}
 
 @mcp.tool()
-async def get_group_members(user_id: str, group_id: str):
+async def get_group_members(user_id: str, group_id: str, page: int = 0, page_size: int = 200):
     """
     Get list of all members in a group.
     User must be a member of the group.
@@ -703,55 +1141,59 @@ async def get_group_members(user_id: str, group_id: str):
     Args:
         user_id: User ID (injected by FastAPI)
         group_id: Group ID
+        page: Zero-based page number (default 0)
+        page_size: Members per page (1-1000, default 200)
         
     Returns:
-        List of group members with details
+        List of group members with details (one page)
     """
     try:
         # Validate group_id
         if not validate_object_id(group_id):
             return {"status": "error", "message": "Invalid group ID format"}
         
+        if page < 0 or not 1 <= page_size <= 1000:
+            return {"status": "error", "message": "page must be >= 0 and page_size between 1 and 1000"}
+        
         # Check if user is member
         if not await is_user_in_group(user_id, group_id):
             return {"status": "error", "message": "Access denied: You are not a member of this group"}
         
-        # Get memberships
-        memberships = await group_members_col.find({
-            "group_id": group_id,
-            "is_active": True
-        }).to_list(None)
-        
-        if not memberships:
-            return []
-        
-        # Get user details
-        user_ids = [ObjectId(m["user_id"]) for m in memberships]
-        users = await users_col.find({"_id": {"$in": user_ids}}).to_list(None)
-        user_map = {str(u["_id"]): u for u in users}
-        
-        # Build member list
-        members = []
-        for membership in memberships:
-            uid = membership["user_id"]
-            user = user_map.get(uid, {})
-            
-            members.append({
-                "user_id": uid,
-                "email": user.get("email", "Unknown"),
-                "full_name": user.get("full_name", "Unknown User"),
-                "role": membership["role"],
-                "joined_at": membership["joined_at"].isoformat() if membership.get("joined_at") else None,
-                "is_you": uid == user_id
-            })
-        
-        # Sort: admins first, then by name
-        members.sort(key=lambda m: (m["role"] != "admin", m.get("full_name", "")))
-        
-        return members
+        # Memberships joined with users, shaped and sorted by the server
+        pipeline = [
+            {"$match": {"group_id": ObjectId(group_id), "is_active": True}},
+            {"$lookup": {
+                "from": "users",
+                "localField": "user_id",
+                "foreignField": "_id",
+                "pipeline": [{"$project": {"email": 1, "full_name": 1}}],
+                "as": "u"
+            }},
+            {"$unwind": {"path": "$u", "preserveNullAndEmptyArrays": True}},
+            {"$project": {
+                "_id": 0,
+                "user_id": {"$toString": "$user_id"},
+                "email": {"$ifNull": ["$u.email", "Unknown"]},
+                "full_name": {"$ifNull": ["$u.full_name", "Unknown User"]},
+                "role": 1,
+                "joined_at": {"$ifNull": ["$joined_at", None]},
+                "is_you": {"$eq": ["$user_id", ObjectId(user_id)]},
+                "_ord": {"$cond": [{"$eq": ["$role", "admin"]}, 0, 1]}
+            }},
+            # Admins first, then by name; user_id makes the order total so
+            # pages never overlap or skip members with the same name
+            {"$sort": {"_ord": 1, "full_name": 1, "user_id": 1}},
+            {"$skip": page * page_size},
+            {"$limit": page_size},
+            {"$project": {"_ord": 0}}
+        ]
+        # Rows arrive in their final shape; no per-member Python work.
+        # joined_at stays a datetime, which FastMCP encodes as ISO 8601.
+        return await group_members_col.aggregate(pipeline, batchSize=page_size).to_list(page_size)
         
-    except Exception as e:
-        return {"status": "error", "message": f"Failed to get group members: {str(e)}"}
+    except (PyMongoError, InvalidId, ValueError) as e:
+        logger.exception("Failed to get group members")
+        return {"status": "error", "message": f"Failed to get group members: {e}"}
 
 
 # ============================================================================
@@ -837,6 +1279,8 @@ async def add_group_expense(
         except ValueError as ve:
             return {"status": "error", "message": f"Split calculation failed: {str(ve)}"}
         
+        now = _now()
+        
         # Create expense document
         expense_doc = {
             "group_id": group_id,
@@ -847,14 +1291,14 @@ async def add_group_expense(
             "category": category,
             "subcategory": subcategory or "",
             "note": note or "",
-            "date": date,
+            "date": parse_date(date),
             "split_type": split_type,
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
+            "created_at": now
         }
         
         # Insert expense
         expense_result = await expenses_col.insert_one(expense_doc)
+        invalidate_summary_cache(user_id)
         expense_id = str(expense_result.inserted_id)
         
         # Create participant records
@@ -864,7 +1308,7 @@ async def add_group_expense(
                 "expense_id": expense_id,
                 "user_id": participant_id,
                 "share_amount": float(share_amount),
-                "created_at": datetime.utcnow()
+                "created_at": now
             }
             
             if split_type == "exact":
@@ -884,7 +1328,7 @@ async def add_group_expense(
         # Create split summary
         split_summary = []
         for participant_id, share_amount in splits.items():
-            user = await users_col.find_one({"_id": ObjectId(participant_id)})
+            user = await users_col.find_one({"_id": ObjectId(participant_id)}, projection=USER_SUMMARY_FIELDS)
             split_summary.append({
                 "user_id": participant_id,
                 "email": user.get("email", "Unknown") if user else "Unknown",
@@ -901,8 +1345,9 @@ async def add_group_expense(
             "message": f"Expense added and split among {len(participants)} participants"
         }
         
-    except Exception as e:
-        return {"status": "error", "message": f"Failed to add group expense: {str(e)}"}
+    except (PyMongoError, InvalidId, ValueError) as e:
+        logger.exception("Failed to add group expense")
+        return {"status": "error", "message": f"Failed to add group expense: {e}"}
 
 @mcp.tool()
 async def list_group_expenses(user_id: str, group_id: str, start_date: str = None, end_date: str = None):
@@ -918,12 +1363,14 @@ async def list_group_expenses(user_id: str, group_id: str, start_date: str = Non
         
         # Build query
         query = {"group_id": group_id}
+        # Whole-day bounds, matching list_expenses and summarize
         if start_date and end_date:
-            query["date"] = {"$gte": start_date, "$lte": end_date}
+            start, end = day_range(start_date, end_date)
+            query["date"] = {"$gte": start, "$lt": end}
         elif start_date:
-            query["date"] = {"$gte": start_date}
+            query["date"] = {"$gte": day_range(start_date, start_date)[0]}
         elif end_date:
-            query["date"] = {"$lte": end_date}
+            query["date"] = {"$lt": day_range(end_date, end_date)[1]}
         
         # Get expenses
         expenses = await expenses_col.find(query).sort("date", -1).to_list(None)
@@ -955,9 +1402,10 @@ async def list_group_expenses(user_id: str, group_id: str, start_date: str = Non
             all_user_ids.add(p["user_id"])
         
         # Get user details
-        users = await users_col.find({
-            "_id": {"$in": [ObjectId(uid) for uid in all_user_ids if validate_object_id(uid)]}
-        }).to_list(None)
+        users = await users_col.find(
+            {"_id": {"$in": [ObjectId(uid) for uid in all_user_ids if validate_object_id(uid)]}},
+            projection=USER_SUMMARY_FIELDS
+        ).to_list(None)
         user_map = {str(u["_id"]): u for u in users}
         
         # Build response
@@ -994,8 +1442,9 @@ async def list_group_expenses(user_id: str, group_id: str, start_date: str = Non
         
         return result
         
-    except Exception as e:
-        return {"status": "error", "message": f"Failed to list group expenses: {str(e)}"}
+    except (PyMongoError, InvalidId, ValueError) as e:
+        logger.exception("Failed to list group expenses")
+        return {"status": "error", "message": f"Failed to list group expenses: {e}"}
 
 @mcp.tool()
 async def get_expense_details(user_id: str, expense_id: str):
@@ -1004,7 +1453,7 @@ async def get_expense_details(user_id: str, expense_id: str):
     """
     try:
         if not validate_object_id(expense_id):
-            return {"status": "error", "message": "Invalid expense ID format"}
+            return _ERR_INVALID_EXPENSE_ID
         
         # Get expense
         expense = await expenses_col.find_one({"_id": ObjectId(expense_id)})
@@ -1029,7 +1478,7 @@ async def get_expense_details(user_id: str, expense_id: str):
         # Get user details
         if participants:
             user_ids = [ObjectId(p["user_id"]) for p in participants]
-            users = await users_col.find({"_id": {"$in": user_ids}}).to_list(None)
+            users = await users_col.find({"_id": {"$in": user_ids}}, projection=USER_SUMMARY_FIELDS).to_list(None)
             user_map = {str(u["_id"]): u for u in users}
             
             splits = []
@@ -1049,7 +1498,7 @@ async def get_expense_details(user_id: str, expense_id: str):
         
         # Get payer details
         paid_by = expense.get("paid_by", expense.get("user_id"))
-        payer = await users_col.find_one({"_id": ObjectId(paid_by)})
+        payer = await users_col.find_one({"_id": ObjectId(paid_by)}, projection=USER_SUMMARY_FIELDS)
         
         expense_data = serialize(expense)
         expense_data["payer"] = {
@@ -1062,8 +1511,9 @@ async def get_expense_details(user_id: str, expense_id: str):
         
         return expense_data
         
-    except Exception as e:
-        return {"status": "error", "message": f"Failed to get expense details: {str(e)}"}
+    except (PyMongoError, InvalidId, ValueError) as e:
+        logger.exception("Failed to get expense details")
+        return {"status": "error", "message": f"Failed to get expense details: {e}"}
 
 # ============================================================================
 # ADMIN TOOLS
@@ -1079,8 +1529,23 @@ async def setup_database():
     try:
         await setup_collection_hybrid()
         return {"status": "success", "message": "Database initialized successfully"}
-    except Exception as e:
+    except (PyMongoError, ValueError) as e:
         return {"status": "error", "message": str(e)}
 
 if __name__ == "__main__":
-    mcp.run(transport="http", host="0.0.0.0", port=8000)
+    # uvloop is a dependency everywhere but Windows, where it does not
+    # exist; there the default asyncio loop is used
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+    # Keep idle client connections open well past uvicorn's 5s default
+    # so MCP clients reuse them between tool calls
+    mcp.run(
+        transport="http",
+        host="0.0.0.0",
+        port=8000,
+        uvicorn_config={"timeout_keep_alive": 75},
+    )